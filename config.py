@@ -2,6 +2,8 @@
 Configuration file for Elephant News Scraper
 """
 
+import re
+
 # Search configuration - Focused keyword set for elephant research
 DEFAULT_KEYWORDS = [
     # Core sightings and presence
@@ -50,6 +52,24 @@ MAX_PAGES_PER_SITE = 5
 REQUEST_TIMEOUT = 10
 DELAY_BETWEEN_REQUESTS = 2
 MAX_RETRIES = 3
+MAX_SCRAPE_WORKERS = 8
+MAX_PAGE_BYTES = 2_000_000
+MAX_CONCURRENT_FETCHES = 8
+GEMINI_WORKERS = 4
+
+# Pre-filters applied before spending a Gemini call on an article
+MIN_ARTICLE_WORDS = 80
+PREFILTER_KEYWORDS = ('elephant', 'tusker', 'gaja')
+
+# Cap on article characters sent per extraction; the lede carries the
+# schema-relevant facts, the tail keeps any closing summary
+MAX_EXTRACTION_CHARS = 8000
+MAX_EXTRACTION_HEAD_CHARS = 4000
+MAX_EXTRACTION_TAIL_CHARS = 1000
+
+# On-disk HTTP response cache (sqlite, via requests-cache)
+HTTP_CACHE_NAME = "elephant_cache"
+HTTP_CACHE_EXPIRE_SECONDS = 86400
 
 # Temporal scope configuration
 START_YEAR = 2000
@@ -128,8 +148,10 @@ CENTRAL_INDIA_DISTRICTS = [
 ]
 
 # Regex patterns for data extraction
+# Numeric patterns are compiled once at module load so the extractor does not
+# re-parse them on every article; IGNORECASE replaces per-call text lowering
 EXTRACTION_PATTERNS = {
-    'elephant_count': [
+    'elephant_count': [re.compile(p, re.IGNORECASE) for p in [
         r'(\d+)\s*elephants?',
         r'(\d+)\s*pachyderms?',
         r'(\d+)\s*jumbos?',
@@ -141,8 +163,8 @@ EXTRACTION_PATTERNS = {
         r'five\s*elephants?',
         r'two\s*elephants?',
         r'one\s*elephant'
-    ],
-    'human_deaths': [
+    ]],
+    'human_deaths': [re.compile(p, re.IGNORECASE) for p in [
         r'(\d+)\s*people?\s*killed',
         r'(\d+)\s*persons?\s*killed',
         r'(\d+)\s*deaths?',
@@ -154,8 +176,8 @@ EXTRACTION_PATTERNS = {
         r'one\s*person?\s*killed',
         r'kills?\s*two\s*people?',
         r'kills?\s*one\s*person?'
-    ],
-    'elephant_deaths': [
+    ]],
+    'elephant_deaths': [re.compile(p, re.IGNORECASE) for p in [
         r'(\d+)\s*elephants?\s*killed',
         r'(\d+)\s*elephants?\s*dead',
         r'(\d+)\s*pachyderms?\s*killed',
@@ -165,7 +187,7 @@ EXTRACTION_PATTERNS = {
         r'(\d+)\s*elephants?\s*died',
         r'dead\s*elephant',
         r'elephant\s*found\s*dead'
-    ],
+    ]],
     'incident_types': [
         'sighting', 'crop damage', 'property damage', 'human death',
         'elephant death', 'conflict', 'attack', 'raid', 'trespass',
@@ -179,17 +201,18 @@ EXTRACTION_PATTERNS = {
     ]
 }
 
-# Date parsing patterns
-DATE_PATTERNS = [
-    r'(\d{1,2})/(\d{1,2})/(\d{4})',
-    r'(\d{1,2})-(\d{1,2})-(\d{4})',
-    r'(\d{4})-(\d{1,2})-(\d{1,2})',
-    r'(\w+)\s+(\d{1,2}),\s+(\d{4})',
-    r'(\d{1,2})\s+(\w+)\s+(\d{4})',
-    r'(\w+)\s+(\d{1,2})\s+(\d{4})',
-    r'(\d{1,2})\.(\d{1,2})\.(\d{4})',
-    r'(\d{4})\.(\d{1,2})\.(\d{1,2})'
-]
+# Date parsing patterns (compiled once at module load), each paired with
+# the strptime format that parses its matches
+DATE_PATTERNS = [(re.compile(p, re.IGNORECASE), fmt) for p, fmt in [
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})', '%d/%m/%Y'),
+    (r'(\d{1,2})-(\d{1,2})-(\d{4})', '%d-%m-%Y'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})', '%Y-%m-%d'),
+    (r'(\w+)\s+(\d{1,2}),\s+(\d{4})', '%B %d, %Y'),
+    (r'(\d{1,2})\s+(\w+)\s+(\d{4})', '%d %B %Y'),
+    (r'(\w+)\s+(\d{1,2})\s+(\d{4})', '%B %d %Y'),
+    (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', '%d.%m.%Y'),
+    (r'(\d{4})\.(\d{1,2})\.(\d{1,2})', '%Y.%m.%d')
+]]
 
 # Gemini API configuration
 GEMINI_API_KEY = None  # Set your API key here or as environment variable
@@ -197,15 +220,19 @@ GEMINI_MODEL = "gemini-2.0-flash"
 GEMINI_MAX_RETRIES = 3
 GEMINI_TIMEOUT = 30
 
-# Gemini extraction prompt template
+# Bump when GEMINI_EXTRACTION_PROMPT changes so stale cache entries miss
+GEMINI_PROMPT_VERSION = "1"
+
+# Directory for cached extraction results; None disables the cache
+GEMINI_CACHE_DIR = None  # e.g. "cache/gemini"
+
+# Gemini extraction prompt template. The large static instructions come
+# first and the per-article fields last, so the shared prefix is identical
+# across calls and provider-side prompt caching can hit.
 GEMINI_EXTRACTION_PROMPT = """
 CRITICAL: Respond ONLY with a valid JSON object. No explanations, no markdown, no code fences, no additional text.
 
-You are an expert data extraction specialist. Extract structured information about elephant incidents from the following news article.
-
-Article Text: {article_text}
-Source URL: {url}
-Source Domain: {source}
+You are an expert data extraction specialist. Extract structured information about elephant incidents from the news article at the end of this prompt.
 
 Respond ONLY in JSON. Do not include any prose, explanations, or markdown. Do not wrap the JSON in code fences. Output must be a single JSON object.
 
@@ -234,8 +261,58 @@ Important rules:
 5. If information is not available, use null
 6. Respond ONLY in JSON with no surrounding text or code blocks
 7. Ensure the JSON is valid and properly formatted
+
+Source Domain: {source}
+Source URL: {url}
+Article Text: {article_text}
+"""
+
+# Gemini batch extraction prompt template. Static instructions first (for
+# provider-side prompt caching), numbered articles appended at the end.
+GEMINI_BATCH_EXTRACTION_PROMPT = """
+CRITICAL: Respond ONLY with a valid JSON object. No explanations, no markdown, no code fences, no additional text.
+
+You are an expert data extraction specialist. Several news articles about elephant incidents follow at the end of this prompt, each preceded by "ARTICLE <number>".
+
+Respond ONLY in JSON with a single object of the form:
+
+{{
+    "results": [
+        {{
+            "Date": "YYYY-MM-DD format or null if not available",
+            "State": "One of: Madhya Pradesh, Chhattisgarh, Telangana, Andhra Pradesh, Maharashtra (or null if not mentioned or not in these states)",
+            "District": "District name or null if not available",
+            "Block": "Block/Tehsil name or null if not available",
+            "Village": "Village name or null if not available",
+            "No. of Elephants": "Number of elephants involved (integer or null)",
+            "Type of Incident": "Type of incident (e.g., attack, death, crop damage, sighting, etc.) or null",
+            "Human Deaths": "Number of human deaths (integer or null)",
+            "Elephant Deaths": "Number of elephant deaths (integer or null)",
+            "Damage (Crop/Property/Other)": "Type of damage caused or null",
+            "Source": "News source name",
+            "URL": "Article URL"
+        }}
+    ]
+}}
+
+The "results" array must contain exactly one object per article, in the same order as the articles appear.
+
+Important rules:
+1. Only include states from the specified list: Madhya Pradesh, Chhattisgarh, Telangana, Andhra Pradesh, Maharashtra
+2. If an article is not about these states, set State to null
+3. Focus on incidents from 2000-2025 (last two decades)
+4. Extract numbers as integers, not strings
+5. If information is not available, use null
+6. Respond ONLY in JSON with no surrounding text or code blocks
+7. Ensure the JSON is valid and properly formatted
+
+{articles}
 """
 
+# Articles per batched Gemini call
+GEMINI_BATCH_SIZE = 4
+GEMINI_USE_BATCH = False  # Set to True to batch articles per Gemini call
+
 # Logging configuration
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
@@ -0,0 +1,815 @@
+"""
+Elephant News Scraper
+Scrapes elephant-related news articles and extracts structured incident data
+using spaCy NER and regex patterns
+"""
+
+import re
+import csv
+import time
+import hashlib
+import logging
+import functools
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from io import BytesIO
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import soupsieve
+import spacy
+from bs4 import BeautifulSoup
+from spacy.matcher import PhraseMatcher
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# pyahocorasick is optional; without it location matching falls back to
+# substring scans over the precomputed lowercase tables
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# requests-cache is optional; without it every run re-fetches all URLs
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# python-dateutil is optional; without it unusual date formats stay raw
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+from config import (
+    DEFAULT_KEYWORDS, NEWS_SITES_CONFIG, CENTRAL_INDIA_STATES,
+    CENTRAL_INDIA_DISTRICTS, EXTRACTION_PATTERNS, DATE_PATTERNS,
+    REQUEST_TIMEOUT, DELAY_BETWEEN_REQUESTS, MAX_RETRIES, MAX_SCRAPE_WORKERS,
+    MAX_PAGE_BYTES, HTTP_CACHE_NAME, HTTP_CACHE_EXPIRE_SECONDS,
+    START_YEAR, END_YEAR,
+    FILTER_BY_DATE, LOG_LEVEL, LOG_FORMAT
+)
+
+# Configure logging
+logging.basicConfig(level=getattr(logging, LOG_LEVEL), format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+# Compiled once at module load - used for temporal scope checks
+YEAR_PATTERN = re.compile(r'(\d{4})')
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    Normalize a date string to YYYY-MM-DD where possible
+
+    Memoized: articles from the same day share identical raw date strings,
+    so each unique string is parsed once.
+
+    Args:
+        date_str: Raw date string from the article
+
+    Returns:
+        Normalized date string, or the raw string if parsing fails
+    """
+    for pattern, fmt in DATE_PATTERNS:
+        match = pattern.search(date_str)
+        if match:
+            try:
+                return datetime.strptime(match.group(0), fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+
+    # Fallback for formats the explicit patterns miss (abbreviated months,
+    # timezone suffixes, etc.)
+    if dateutil_parser is not None:
+        try:
+            return dateutil_parser.parse(date_str, fuzzy=True).strftime('%Y-%m-%d')
+        except (ValueError, OverflowError):
+            pass
+
+    return date_str
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_within_temporal_scope_cached(date_str: Optional[str]) -> bool:
+    """
+    Check if a date string falls within the configured temporal scope
+
+    Memoized on the raw date string alongside _parse_date_cached.
+
+    Args:
+        date_str: Date string to check
+
+    Returns:
+        True if within scope (or scope can't be determined), False otherwise
+    """
+    if not FILTER_BY_DATE or not date_str:
+        return True
+
+    year_match = YEAR_PATTERN.search(date_str)
+    if year_match:
+        year = int(year_match.group(1))
+        return START_YEAR <= year <= END_YEAR
+
+    # If we can't determine the year, include the article
+    logger.warning(f"Could not determine year for date: {date_str}")
+    return True
+
+# Output CSV column order
+OUTPUT_FIELDS = [
+    'Date', 'State', 'District', 'Block', 'Village', 'No. of Elephants',
+    'Type of Incident', 'Human Deaths', 'Elephant Deaths',
+    'Damage (Crop/Property/Other)', 'Source', 'URL'
+]
+
+# Fallback selectors tried after any site-specific ones
+DEFAULT_TITLE_SELECTORS = ['h1', '.headline', 'title']
+DEFAULT_DATE_SELECTORS = ['time', '.date', '.publish-date']
+DEFAULT_CONTENT_SELECTORS = ['article p', '.article-body p', 'p']
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_selector(selector: str):
+    """
+    Compile a CSS selector once and reuse it across articles
+
+    Args:
+        selector: CSS selector string
+
+    Returns:
+        Compiled soupsieve selector
+    """
+    return soupsieve.compile(selector)
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """
+    Check that text[start:end] is not embedded inside a longer word
+
+    Args:
+        text: Haystack the match came from
+        start: Match start index
+        end: Match end index (exclusive)
+
+    Returns:
+        True when the adjacent characters are non-alphabetic
+    """
+    if start > 0 and text[start - 1].isalpha():
+        return False
+    if end < len(text) and text[end].isalpha():
+        return False
+    return True
+
+
+def _find_word_bounded(text: str, key: str) -> bool:
+    """
+    Check whether key occurs in text as a whole word
+
+    Args:
+        text: Haystack to scan
+        key: Needle to look for
+
+    Returns:
+        True when a word-bounded occurrence exists
+    """
+    pos = text.find(key)
+    while pos != -1:
+        if _is_word_bounded(text, pos, pos + len(key)):
+            return True
+        pos = text.find(key, pos + 1)
+    return False
+
+
+def _build_keyword_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton over a keyword collection
+
+    Args:
+        keywords: Lowercase keywords to match
+
+    Returns:
+        Finalized automaton, or None when pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# Word-to-number mapping for written-out counts
+TEXT_NUMBERS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
+
+
+def _build_numeric_regex(patterns) -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Combine a field's numeric patterns into a single alternation regex
+
+    Digit-capturing patterns become named groups n<i>, written-out number
+    patterns become named groups w<i> mapped to their integer value, so one
+    pass over the text replaces a sequential scan per pattern and each
+    match resolves to a number without substring probing.
+
+    Args:
+        patterns: List of compiled per-field patterns from EXTRACTION_PATTERNS
+
+    Returns:
+        Tuple of (compiled case-insensitive alternation regex,
+        word group name -> number mapping)
+    """
+    parts = []
+    group_numbers = {}
+    for i, pattern in enumerate(patterns):
+        raw = pattern.pattern
+        if r'(\d+)' in raw:
+            parts.append(raw.replace(r'(\d+)', fr'(?P<n{i}>\d+)', 1))
+        else:
+            parts.append(fr'(?P<w{i}>{raw})')
+            word = next((w for w in TEXT_NUMBERS if w in raw), None)
+            if word is not None:
+                group_numbers[f'w{i}'] = TEXT_NUMBERS[word]
+    return re.compile('|'.join(parts), re.IGNORECASE), group_numbers
+
+
+# One combined regex (plus word-group number mapping) per numeric field, so
+# each article is scanned once per field instead of once per pattern
+NUMERIC_REGEXES = {
+    field: _build_numeric_regex(EXTRACTION_PATTERNS[field])
+    for field in ('elephant_count', 'human_deaths', 'elephant_deaths')
+}
+
+
+class ElephantNewsScraper:
+    """
+    Scrapes elephant news articles from provided URLs
+    """
+
+    def __init__(self):
+        # Cache responses on disk so re-runs over the same URL list become
+        # local sqlite reads instead of live fetches
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                          'AppleWebKit/537.36 (KHTML, like Gecko) '
+                          'Chrome/120.0 Safari/537.36',
+            'Connection': 'keep-alive'
+        })
+
+        # Pooled keep-alive connections with retries, mounted once so TCP/TLS
+        # handshakes are reused across articles from the same site
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Per-host politeness state for parallel scraping
+        self._host_locks = defaultdict(threading.Lock)
+        self._last_fetch_times = {}
+
+        # The selector lists are static, so compile them once here instead
+        # of re-parsing the selector strings on every article
+        self._default_selectors = {
+            'title': [_compile_selector(s) for s in DEFAULT_TITLE_SELECTORS],
+            'date': [_compile_selector(s) for s in DEFAULT_DATE_SELECTORS],
+            'content': [_compile_selector(s) for s in DEFAULT_CONTENT_SELECTORS]
+        }
+        self.site_configs = NEWS_SITES_CONFIG
+        self.keywords = DEFAULT_KEYWORDS
+        self._site_selectors = {}
+        for site in self.site_configs.values():
+            selectors = site['article_selectors']
+            self._site_selectors[urlparse(site['base_url']).netloc] = {
+                field: [_compile_selector(selectors[field])] + self._default_selectors[field]
+                for field in ('title', 'date', 'content')
+            }
+
+        # Load spaCy model for location extraction; only the tokenizer is
+        # needed for the PhraseMatcher, so skip every trained component
+        try:
+            self.nlp = spacy.load(
+                "en_core_web_sm",
+                disable=["ner", "parser", "lemmatizer", "attribute_ruler"]
+            )
+        except OSError:
+            logger.error("spaCy model not found. Run: python -m spacy download en_core_web_sm")
+            raise
+
+    def scrape_urls(self, urls: List[str]) -> List[Dict]:
+        """
+        Scrape a list of article URLs in parallel
+
+        Args:
+            urls: List of article URLs to scrape
+
+        Returns:
+            List of article dictionaries
+        """
+        return list(self.scrape_urls_iter(urls))
+
+    def scrape_urls_iter(self, urls: List[str]):
+        """
+        Scrape article URLs in parallel, yielding each article as it completes
+
+        URLs are fetched by a thread pool; the politeness delay is enforced
+        per host, so different sites are scraped concurrently while each
+        individual site still sees at most one request per delay interval.
+        Yielding as results arrive lets downstream extraction overlap with
+        in-flight fetches and keeps memory independent of the corpus size.
+
+        Args:
+            urls: List of article URLs to scrape
+
+        Yields:
+            Article dictionaries
+        """
+        # Drop duplicate URLs up front, preserving order
+        urls = list(dict.fromkeys(urls))
+
+        scraped = 0
+        with ThreadPoolExecutor(max_workers=MAX_SCRAPE_WORKERS) as executor:
+            futures = {executor.submit(self._scrape_politely, url): url for url in urls}
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                logger.info(f"Finished URL {i}/{len(urls)}: {url}")
+                article = future.result()
+                if article:
+                    scraped += 1
+                    yield article
+
+        logger.info(f"Scraped {scraped} articles from {len(urls)} URLs")
+
+    def _scrape_politely(self, url: str) -> Optional[Dict]:
+        """
+        Scrape a single URL after honoring the per-host politeness delay
+
+        Args:
+            url: Article URL to scrape
+
+        Returns:
+            Dictionary with article data or None if failed
+        """
+        host = urlparse(url).netloc
+        with self._host_locks[host]:
+            last_fetch = self._last_fetch_times.get(host, 0.0)
+            wait = DELAY_BETWEEN_REQUESTS - (time.monotonic() - last_fetch)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_fetch_times[host] = time.monotonic()
+        return self._scrape_single_url(url)
+
+    def _scrape_single_url(self, url: str) -> Optional[Dict]:
+        """
+        Scrape a single article URL
+
+        Args:
+            url: Article URL to scrape
+
+        Returns:
+            Dictionary with article data or None if failed
+        """
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+            response.raise_for_status()
+
+            # A PDF or other non-HTML payload would never yield article
+            # data, so bail out before paying for the parse
+            content_type = response.headers.get('Content-Type', '')
+            if 'html' not in content_type:
+                logger.warning(f"Skipping non-HTML response ({content_type or 'unknown type'}): {url}")
+                return None
+
+            # Stream the body with a size cap so a pathological multi-MB
+            # page never gets fully materialized (or parsed past the cap)
+            body = BytesIO()
+            total = 0
+            for chunk in response.iter_content(64 * 1024):
+                total += len(chunk)
+                if total > MAX_PAGE_BYTES:
+                    logger.warning(f"Page exceeds {MAX_PAGE_BYTES} bytes, truncating: {url}")
+                    break
+                body.write(chunk)
+
+            page = body.getvalue()
+            if len(page) < 500:
+                logger.warning(f"Response too small to be an article ({len(page)} bytes): {url}")
+                return None
+
+            # lxml is roughly an order of magnitude faster than the
+            # pure-Python html.parser on news-sized pages
+            soup = BeautifulSoup(page, 'lxml')
+
+            # Use precompiled site-specific selectors if the URL matches a
+            # configured site, otherwise the precompiled defaults
+            host = urlparse(url).netloc
+            selectors = self._site_selectors.get(host, self._default_selectors)
+
+            title = self._extract_text_with_selectors(soup, selectors['title'])
+            date = self._extract_text_with_selectors(soup, selectors['date'])
+            content = self._extract_content_with_selectors(soup, selectors['content'])
+
+            if not title or not content:
+                logger.warning(f"No content found for: {url}")
+                return None
+
+            domain = urlparse(url).netloc
+            source = domain.replace('www.', '').replace('.com', '').replace('.in', '').title()
+
+            return {
+                'url': url,
+                'title': title,
+                'date': date,
+                'source': source,
+                'content': content
+            }
+
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {str(e)}")
+            return None
+
+    def _extract_text_with_selectors(self, soup, selectors: List) -> Optional[str]:
+        """
+        Try a list of compiled CSS selectors and return text from the first match
+
+        Args:
+            soup: BeautifulSoup object
+            selectors: Compiled soupsieve selectors to try, in order
+
+        Returns:
+            Extracted text or None
+        """
+        for selector in selectors:
+            element = selector.select_one(soup)
+            if element:
+                text = element.get_text(strip=True)
+                if text:
+                    return text
+        return None
+
+    def _extract_content_with_selectors(self, soup, selectors: List) -> Optional[str]:
+        """
+        Try a list of compiled CSS selectors and return joined paragraph text
+        from the first match
+
+        Args:
+            soup: BeautifulSoup object
+            selectors: Compiled soupsieve selectors to try, in order
+
+        Returns:
+            Joined article text or None
+        """
+        for selector in selectors:
+            elements = selector.select(soup)
+            if elements:
+                text = ' '.join(el.get_text(strip=True) for el in elements)
+                if text:
+                    return text
+        return None
+
+
+class ElephantDataExtractor:
+    """
+    Extracts structured elephant incident data from article text
+    """
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.states = CENTRAL_INDIA_STATES
+        self.districts = CENTRAL_INDIA_DISTRICTS
+        self.patterns = EXTRACTION_PATTERNS
+        self.date_patterns = DATE_PATTERNS
+
+        # Lowercase -> canonical name tables, built once; the fallback
+        # scan tries longer names first so 'Baloda Bazar' beats 'Balod'
+        self._state_lower = {s.lower(): s for s in self.states}
+        self._district_lower = {d.lower(): d for d in self.districts}
+        self._state_keys_by_len = sorted(self._state_lower, key=len, reverse=True)
+        self._district_keys_by_len = sorted(self._district_lower, key=len, reverse=True)
+
+        # Aho-Corasick automaton over all state/district names: one linear
+        # pass over the article text instead of entities x districts scans
+        if ahocorasick is not None:
+            self._location_automaton = ahocorasick.Automaton()
+            for key, canonical in self._state_lower.items():
+                self._location_automaton.add_word(key, ('state', key, canonical))
+            for key, canonical in self._district_lower.items():
+                self._location_automaton.add_word(key, ('district', key, canonical))
+            self._location_automaton.make_automaton()
+        else:
+            self._location_automaton = None
+
+        # PhraseMatcher resolves state/district names in one C-level pass
+        # over the token stream, replacing the NER-entity post-filtering
+        self.matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self.matcher.add("STATE", [nlp.make_doc(s) for s in self.states])
+        self.matcher.add("DISTRICT", [nlp.make_doc(d) for d in self.districts])
+
+        # Frozen keyword sets: O(1) membership for exact-token checks and
+        # immutable (thread-safe) under the parallel scraping path
+        self._incident_set = frozenset(self.patterns['incident_types'])
+        self._damage_set = frozenset(self.patterns['damage_types'])
+
+        # Keyword automatons: one linear sweep over the text replaces a
+        # substring check per incident/damage keyword
+        self._incident_automaton = _build_keyword_automaton(self._incident_set)
+        self._damage_automaton = _build_keyword_automaton(self._damage_set)
+
+    def extract_structured_data(self, article: Dict, doc=None) -> Dict:
+        """
+        Extract structured incident data from a scraped article
+
+        Args:
+            article: Dictionary with article data (title, content, date, source, url)
+            doc: Optional pre-parsed spaCy Doc for the article text; parsed
+                on demand when not supplied (batch callers should use
+                nlp.pipe and pass docs in)
+
+        Returns:
+            Dictionary with extracted fields matching the output schema
+        """
+        full_text = f"{article['title']} {article['content']}"
+        # Lower the article text once and share it across the keyword and
+        # location helpers instead of re-allocating a copy per helper
+        full_text_lower = full_text.lower()
+
+        # Match locations with one linear automaton pass; fall back to
+        # spaCy NER only when nothing is found
+        state, district = self._match_locations(full_text_lower)
+        if state is None and district is None:
+            if doc is None:
+                doc = self.nlp(full_text)
+            state, district = self._extract_locations(doc)
+
+        return {
+            'Date': self._parse_date(article['date']) if article.get('date') else None,
+            'State': state,
+            'District': district,
+            'Block': None,
+            'Village': None,
+            'No. of Elephants': self._extract_number(full_text, 'elephant_count'),
+            'Type of Incident': self._extract_incident_type(full_text_lower),
+            'Human Deaths': self._extract_number(full_text, 'human_deaths'),
+            'Elephant Deaths': self._extract_number(full_text, 'elephant_deaths'),
+            'Damage (Crop/Property/Other)': self._extract_damage_type(full_text_lower),
+            'Source': article.get('source'),
+            'URL': article.get('url')
+        }
+
+    def _match_locations(self, text_lower: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Match state and district names directly against the article text
+
+        Args:
+            text_lower: Lowercased full article text
+
+        Returns:
+            Tuple of (state, district), either may be None
+        """
+        state = None
+        district = None
+
+        if self._location_automaton is not None:
+            # Keep the longest word-bounded hit per kind so a name that
+            # contains a shorter one (e.g. 'Baloda Bazar' over 'Balod')
+            # wins, and substrings of unrelated words are rejected
+            best_state_len = 0
+            best_district_len = 0
+            for end_index, (kind, key, canonical) in self._location_automaton.iter(text_lower):
+                start = end_index - len(key) + 1
+                if not _is_word_bounded(text_lower, start, end_index + 1):
+                    continue
+                if kind == 'state':
+                    if len(key) > best_state_len:
+                        state = canonical
+                        best_state_len = len(key)
+                elif len(key) > best_district_len:
+                    district = canonical
+                    best_district_len = len(key)
+        else:
+            for key in self._state_keys_by_len:
+                if _find_word_bounded(text_lower, key):
+                    state = self._state_lower[key]
+                    break
+            for key in self._district_keys_by_len:
+                if _find_word_bounded(text_lower, key):
+                    district = self._district_lower[key]
+                    break
+
+        return state, district
+
+    def _extract_locations(self, doc) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract state and district names from a tokenized spaCy Doc
+
+        Args:
+            doc: spaCy Doc for the full article text
+
+        Returns:
+            Tuple of (state, district), either may be None
+        """
+        state = None
+        district = None
+
+        try:
+            for match_id, start, end in self.matcher(doc):
+                label = doc.vocab.strings[match_id]
+                span_lower = doc[start:end].text.lower()
+                if label == 'STATE':
+                    if state is None:
+                        state = self._state_lower.get(span_lower)
+                elif district is None:
+                    district = self._district_lower.get(span_lower)
+                if state is not None and district is not None:
+                    break
+        except Exception as e:
+            logger.error(f"Error extracting locations: {str(e)}")
+
+        return state, district
+
+    def _extract_number(self, text: str, field: str) -> Optional[int]:
+        """
+        Extract the first number for a field using its combined regex
+
+        Args:
+            text: Text to search
+            field: Field key in NUMERIC_REGEXES (e.g. 'elephant_count')
+
+        Returns:
+            Extracted number or None
+        """
+        regex, group_numbers = NUMERIC_REGEXES[field]
+        for match in regex.finditer(text):
+            group_name = match.lastgroup
+            if group_name.startswith('n'):
+                return int(match.group(group_name))
+            # Written-out numbers resolve directly through the group mapping
+            number = group_numbers.get(group_name)
+            if number is not None:
+                return number
+        return None
+
+    def _extract_incident_type(self, text_lower: str) -> Optional[str]:
+        """
+        Classify the incident type from keyword matches
+
+        Args:
+            text_lower: Lowercased full article text
+
+        Returns:
+            Incident type keyword or None
+        """
+        if self._incident_automaton is not None:
+            for _, keyword in self._incident_automaton.iter(text_lower):
+                return keyword
+            return None
+        # Iterate the configured list, not the frozenset, so the winning
+        # keyword follows the list's priority order deterministically
+        for incident_type in self.patterns['incident_types']:
+            if incident_type in text_lower:
+                return incident_type
+        return None
+
+    def _extract_damage_type(self, text_lower: str) -> Optional[str]:
+        """
+        Identify the type of damage caused from keyword matches
+
+        Args:
+            text_lower: Lowercased full article text
+
+        Returns:
+            Damage type keyword or None
+        """
+        if self._damage_automaton is not None:
+            for _, keyword in self._damage_automaton.iter(text_lower):
+                return keyword
+            return None
+        for damage_type in self.patterns['damage_types']:
+            if damage_type in text_lower:
+                return damage_type
+        return None
+
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[str]:
+        """
+        Normalize a date string to YYYY-MM-DD where possible
+
+        Args:
+            date_str: Raw date string from the article
+
+        Returns:
+            Normalized date string, or the raw string if parsing fails
+        """
+        return _parse_date_cached(date_str)
+
+    @staticmethod
+    def _is_within_temporal_scope(date_str: Optional[str]) -> bool:
+        """
+        Check if article date falls within the configured temporal scope
+
+        Args:
+            date_str: Date string to check
+
+        Returns:
+            True if within scope (or scope can't be determined), False otherwise
+        """
+        return _is_within_temporal_scope_cached(date_str)
+
+
+def main():
+    """
+    Main function: scrape URLs from a file and extract structured data
+    """
+    print("Elephant News Scraper - NER/Regex Extraction")
+    print("=" * 50)
+
+    file_path = input("Enter path to file containing URLs (e.g., sample_urls.txt): ").strip()
+    if not file_path:
+        file_path = "sample_urls.txt"
+
+    urls = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                urls.append(url)
+
+    if not urls:
+        print(f"No URLs found in {file_path}")
+        return
+
+    scraper = ElephantNewsScraper()
+    extractor = ElephantDataExtractor(scraper.nlp)
+
+    def in_scope_articles():
+        """Yield (text, article) pairs for in-scope, non-duplicate articles"""
+        seen_hashes = set()
+        for article in scraper.scrape_urls_iter(urls):
+            if not extractor._is_within_temporal_scope(article.get('date')):
+                logger.info(f"Article outside temporal scope, skipping: {article['url']}")
+                continue
+            # Skip articles whose content was already seen (syndicated
+            # copies, same story under multiple URLs) before extraction
+            content_hash = hashlib.sha256(article['content'].encode('utf-8')).hexdigest()
+            if content_hash in seen_hashes:
+                logger.info(f"Duplicate article content, skipping: {article['url']}")
+                continue
+            seen_hashes.add(content_hash)
+            yield f"{article['title']} {article['content']}", article
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"elephant_data_{timestamp}.csv"
+
+    # Fully streaming pipeline: each article flows scrape -> tokenize ->
+    # extract -> writerow without intermediate lists, so memory stays
+    # constant in the corpus size. nlp.pipe still batches tokenization
+    # internally while consuming the generator lazily.
+    record_count = 0
+    state_counts = Counter()
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+        writer.writeheader()
+        for doc, article in scraper.nlp.pipe(in_scope_articles(), as_tuples=True, batch_size=32):
+            record = extractor.extract_structured_data(article, doc)
+            writer.writerow(record)
+            record_count += 1
+            if record['State']:
+                state_counts[record['State']] += 1
+
+    if record_count == 0:
+        print("No structured data extracted")
+        return
+
+    print(f"\nExtracted {record_count} records")
+    print(f"Data saved to {filename}")
+    if state_counts:
+        print("\nState-wise Distribution:")
+        for state, count in state_counts.most_common():
+            print(f"{state}: {count} articles")
+
+
+if __name__ == "__main__":
+    main()
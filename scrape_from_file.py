@@ -5,7 +5,6 @@ Uses the new modular functions from manual_url_scraper.py
 
 import logging
 from datetime import datetime
-from manual_url_scraper import process_urls_from_file, load_urls
 from config import INCLUDE_TIMESTAMP_IN_FILENAME
 
 # Configure logging
@@ -17,6 +16,10 @@ def main():
     """
     Main function to scrape URLs from file using the new modular approach
     """
+    # Imported here so startup (and prompt display) is instant; this pulls
+    # in pandas, newspaper and the Gemini client transitively
+    from manual_url_scraper import process_urls_from_file, load_urls
+
     print("Elephant News Article Scraper - File-based Processing")
     print("=" * 60)
     